@@ -1,12 +1,9 @@
 import os
-os.environ['TF_ENABLE_ONEDNN_OPTS'] = '0'  # Disables oneDNN warnings
-from core.geological_engine import GeologicalEngine
 from core.survey_manager import SurveyManager
-from utils.online_learner import OnlineLearner
-from utils.map_generator import MapGenerator
-from utils.survey_processor import SurveyProcessor
 import argparse
-import matplotlib.pyplot as plt
+
+# TensorFlow, matplotlib and the HTTP client are imported lazily inside the
+# commands that need them to keep startup fast for the other commands
 
 def main():
     parser = argparse.ArgumentParser(description="Geological Exploration AI System")
@@ -19,21 +16,21 @@ def main():
                        help="Add description to a survey")
     
     args = parser.parse_args()
-    engine = GeologicalEngine()
-    online_learner = OnlineLearner()
-    map_generator = MapGenerator()
-    survey_manager = SurveyManager()
-    survey_processor = SurveyProcessor()
     
     if args.update:
+        from utils.online_learner import OnlineLearner
         print("Updating knowledge base from online sources...")
+        online_learner = OnlineLearner()
         online_learner.update_knowledge_base()
         print("Knowledge base updated successfully.")
         
     elif args.identify:
+        os.environ['TF_ENABLE_ONEDNN_OPTS'] = '0'  # Disables oneDNN warnings
+        from core.geological_engine import GeologicalEngine
         print(f"Identifying sample from {args.identify}...")
         try:
-            result = engine.identify_mineral(args.identify) or engine.identify_rock(args.identify)
+            engine = GeologicalEngine()
+            result = engine.identify(args.identify)
             if result:
                 print("\nIdentification Result:")
                 for key, value in result.items():
@@ -49,11 +46,14 @@ def main():
         pass
         
     elif args.generate_map:
+        import matplotlib.pyplot as plt
+        from utils.map_generator import MapGenerator
+        from utils.survey_processor import SurveyProcessor
         print(f"Generating geological map for survey {args.generate_map}...")
-        survey_data = survey_manager.get_survey_for_mapping(args.generate_map)
+        survey_data = SurveyManager().get_survey_for_mapping(args.generate_map)
         if survey_data:
-            processed_data = survey_processor.process_survey_data(survey_data)
-            fig = map_generator.generate_detailed_map(processed_data)
+            processed_data = SurveyProcessor().process_survey_data(survey_data)
+            fig = MapGenerator().generate_detailed_map(processed_data)
             plt.show()
         else:
             print(f"Survey {args.generate_map} not found.")
@@ -73,13 +73,13 @@ def main():
                 print("Invalid format. Use 'lat,lon,elevation'")
         
         formation = input("Geological formation (optional): ")
-        survey_id = survey_manager.create_survey(coordinates, formation)
+        survey_id = SurveyManager().create_survey(coordinates, formation)
         print(f"Created new survey with ID: {survey_id}")
         
     elif args.add_description:
         survey_id, description = args.add_description
         print(f"Adding description to survey {survey_id}...")
-        result = survey_manager.add_description(survey_id, description)
+        result = SurveyManager().add_description(survey_id, description)
         
         if result:
             print(f"\nInferred {result['type']}: {result['data']['name']}")
@@ -0,0 +1,25 @@
+"""JSON helpers using orjson when available, falling back to the stdlib"""
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on installed packages
+    orjson = None
+    import json
+
+
+def loads(data: bytes) -> Any:
+    """Parse JSON from raw bytes"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any, indent: bool = True) -> bytes:
+    """Serialize to newline-terminated JSON bytes, indented unless indent is False"""
+    if orjson is not None:
+        option = orjson.OPT_APPEND_NEWLINE | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(obj, option=option)
+    if indent:
+        return (json.dumps(obj, indent=2) + "\n").encode("utf-8")
+    return (json.dumps(obj, separators=(",", ":")) + "\n").encode("utf-8")
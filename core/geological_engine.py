@@ -1,15 +1,89 @@
+import ctypes
+import os
+import queue
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 import tensorflow as tf
 import numpy as np
 from PIL import Image
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
 from .knowledge_base import KnowledgeBase
 
+# External XNNPACK delegate with quantized (QS8) kernels; see _make_interpreter
+XNNPACK_DELEGATE_LIB = "libtensorflowlite_xnnpack_delegate.so"
+
+# Calibration samples used for INT8 quantization
+CALIBRATION_SAMPLES = 100
+CALIBRATION_EXTENSIONS = {".jpg", ".jpeg", ".png", ".bmp", ".tif", ".tiff"}
+
+# Inputs larger than this get a preprocessed .npz sidecar so later runs skip decoding
+SIDECAR_MIN_BYTES = 1 << 20
+SIDECAR_SUFFIX = ".prep128.npz"
+INPUT_SHAPE = (1, 128, 128, 3)
+
+def _library_loadable(name: str) -> bool:
+    """Whether a shared library can be found and loaded"""
+    try:
+        ctypes.CDLL(name)
+    except OSError:
+        return False
+    return True
+
+def _read_sidecar(sidecar: Path, mtime_ns: int, size: int) -> Optional[np.ndarray]:
+    """Return the cached input if the sidecar was built from this exact source file, else None"""
+    try:
+        with np.load(sidecar, allow_pickle=False) as data:
+            img_array, source = data["image"], data["source"]
+    except Exception:
+        return None  # Missing, truncated or foreign file; rebuild it
+    if (img_array.shape != INPUT_SHAPE or img_array.dtype != np.float32
+            or source.tolist() != [size, mtime_ns]):
+        return None
+    return img_array
+
+def _write_sidecar(sidecar: Path, img_array: np.ndarray, mtime_ns: int, size: int) -> None:
+    tmp_path = sidecar.with_name(sidecar.name + ".tmp")
+    try:
+        with open(tmp_path, 'wb') as f:
+            np.savez(f, image=img_array, source=np.array([size, mtime_ns], dtype=np.int64))
+        os.replace(tmp_path, sidecar)
+    except OSError:
+        tmp_path.unlink(missing_ok=True)  # Read-only location; the in-memory cache still applies
+
+@lru_cache(maxsize=128)
+def _prep_cached(path_str: str, mtime_ns: int, size: int) -> np.ndarray:
+    """Load a preprocessed image once per modification time (read-only, shared between callers)"""
+    sidecar = Path(path_str + SIDECAR_SUFFIX)
+    img_array = _read_sidecar(sidecar, mtime_ns, size) if size >= SIDECAR_MIN_BYTES else None
+
+    if img_array is None:
+        img_array = _load_image(path_str)
+        if size >= SIDECAR_MIN_BYTES:
+            _write_sidecar(sidecar, img_array, mtime_ns, size)
+
+    img_array.flags.writeable = False
+    return img_array
+
+def _load_image(image_path: str) -> np.ndarray:
+    """Load, resize and normalize an image"""
+    img = Image.open(image_path)
+    img.draft('RGB', (128, 128))  # Let the JPEG decoder downscale large photos while decoding
+    img = img.convert('RGB').resize((128, 128), Image.BILINEAR)
+    img_array = np.asarray(img, dtype=np.float32)
+    img_array *= 1.0 / 255.0  # Normalize to [0,1] in place
+    return np.ascontiguousarray(img_array[np.newaxis, ...])  # Create batch axis
+
 class GeologicalEngine:
-    def __init__(self):
+    # Checked on the first interpreter and set to False after a failed delegate
+    # load, so a missing library isn't retried per interpreter
+    _xnnpack_available: Optional[bool] = None
+
+    def __init__(self, models_dir: Optional[Path] = None):
         self.knowledge_base = KnowledgeBase()
-        self.models_dir = Path(__file__).parent.parent / "models"
+        self.models_dir = models_dir or Path(__file__).parent.parent / "models"
         self.models_dir.mkdir(exist_ok=True)  # Ensure models directory exists
+        self.calibration_dir = self.models_dir / "calibration"  # Sample images for INT8 quantization
         
         # Initialize class mappings
         self.mineral_classes = {
@@ -26,9 +100,148 @@ class GeologicalEngine:
             3: "Limestone"
         }
 
-        # Load or create models
-        self.mineral_model = self._load_model("mineral_classifier.h5")
-        self.rock_model = self._load_model("rock_classifier.h5")
+        # Load or create models, preferring quantized TFLite interpreters
+        self._mineral_tflite, self.mineral_interpreter, self.mineral_model = self._load_classifier("mineral_classifier.h5")
+        self._rock_tflite, self.rock_interpreter, self.rock_model = self._load_classifier("rock_classifier.h5")
+        self._mineral_fn = self._build_inference_fn(self.mineral_interpreter, self.mineral_model)
+        self._rock_fn = self._build_inference_fn(self.rock_interpreter, self.rock_model)
+
+        # Per-thread interpreters for identify_batch, built on first use
+        self._pool_size = os.cpu_count() or 1
+        self._interp_pool: Optional[queue.Queue] = None
+
+    def _load_classifier(self, model_name: str) -> Tuple[Optional[bytes], Optional[tf.lite.Interpreter], Optional[tf.keras.Model]]:
+        """Load the TFLite flatbuffer and an interpreter for the model, falling back to the Keras model"""
+        keras_path = self.models_dir / model_name
+        tflite_path = keras_path.with_suffix(".tflite")
+        failed_marker = keras_path.with_suffix(".tflite.failed")
+
+        # Regenerate the .tflite file when it is missing or older than the Keras source
+        if not tflite_path.exists() or self._is_stale(tflite_path, keras_path):
+            # Don't retry a conversion that already failed for this Keras file
+            if failed_marker.exists() and not self._is_stale(failed_marker, keras_path):
+                return None, None, self._load_model(model_name)
+
+            keras_model = self._load_model(model_name)
+            try:
+                tflite_path.write_bytes(self._convert_to_tflite(keras_model, self._representative_dataset))
+                failed_marker.unlink(missing_ok=True)
+            except Exception as e:
+                print(f"TFLite conversion of {model_name} failed. Using Keras model. Error: {str(e)}")
+                failed_marker.touch()
+                return None, None, keras_model
+
+        try:
+            model_content = tflite_path.read_bytes()
+            return model_content, self._make_interpreter(model_content), None
+        except Exception as e:
+            print(f"Could not load {tflite_path.name}. Using Keras model. Error: {str(e)}")
+            return None, None, self._load_model(model_name)
+
+    @staticmethod
+    def _is_stale(derived: Path, source: Path) -> bool:
+        """Whether a file derived from source is older than it"""
+        return source.exists() and source.stat().st_mtime > derived.stat().st_mtime
+
+    @classmethod
+    def _make_interpreter(cls, model_content: bytes, num_threads: Optional[int] = None) -> tf.lite.Interpreter:
+        """Create an interpreter with allocated tensors from a TFLite flatbuffer"""
+        num_threads = num_threads or os.cpu_count()
+
+        # On x86 the INT8 model is only faster than FP32 when XNNPACK's quantized
+        # kernels are enabled, so request them explicitly. On ARM the built-in
+        # kernels already win, and a missing or non-QS8 delegate build falls
+        # back to the default interpreter. Standard TF wheels don't ship the
+        # library, and load_delegate on a missing one leaves a half-built
+        # Delegate that prints a traceback when collected, so look first.
+        if cls._xnnpack_available is None:
+            cls._xnnpack_available = _library_loadable(XNNPACK_DELEGATE_LIB)
+        if cls._xnnpack_available:
+            try:
+                delegate = tf.lite.experimental.load_delegate(
+                    XNNPACK_DELEGATE_LIB, options={"xnnpack_enable_qs8": "true"}
+                )
+                interpreter = tf.lite.Interpreter(
+                    model_content=model_content,
+                    experimental_delegates=[delegate],
+                    num_threads=num_threads
+                )
+                interpreter.allocate_tensors()
+                return interpreter
+            except Exception:
+                cls._xnnpack_available = False
+
+        interpreter = tf.lite.Interpreter(model_content=model_content, num_threads=num_threads)
+        interpreter.allocate_tensors()
+        return interpreter
+
+    def _representative_dataset(self):
+        """Yield preprocessed calibration images from models/calibration"""
+        samples = []
+        if self.calibration_dir.is_dir():
+            samples = sorted(
+                path for path in self.calibration_dir.iterdir()
+                if path.suffix.lower() in CALIBRATION_EXTENSIONS
+            )[:CALIBRATION_SAMPLES]
+
+        if samples:
+            for path in samples:
+                yield [_load_image(str(path))]
+            return
+
+        # Without real images the activation ranges are only a rough guess
+        print(f"No calibration images in {self.calibration_dir}. "
+              "Calibrating INT8 quantization on random data; accuracy may suffer.")
+        rng = np.random.default_rng(0)
+        for _ in range(CALIBRATION_SAMPLES):
+            yield [rng.random((1, 128, 128, 3), dtype=np.float32)]
+
+    @staticmethod
+    def _convert_to_tflite(keras_model: tf.keras.Model, rep_gen) -> bytes:
+        """Convert a Keras model to an INT8 TFLite flatbuffer, falling back to FP32"""
+        try:
+            converter = tf.lite.TFLiteConverter.from_keras_model(keras_model)
+            converter.optimizations = [tf.lite.Optimize.DEFAULT]
+            converter.representative_dataset = rep_gen
+            converter.target_spec.supported_ops = [tf.lite.OpsSet.TFLITE_BUILTINS_INT8]
+            converter.inference_input_type = tf.int8
+            converter.inference_output_type = tf.int8
+            return converter.convert()
+        except Exception as e:
+            print(f"INT8 quantization failed. Falling back to FP32 TFLite. Error: {str(e)}")
+            return tf.lite.TFLiteConverter.from_keras_model(keras_model).convert()
+
+    @staticmethod
+    def _run_interpreter(interpreter: tf.lite.Interpreter, img: np.ndarray) -> np.ndarray:
+        """Run a single image through a TFLite interpreter, handling (de)quantization"""
+        input_details = interpreter.get_input_details()[0]
+        output_details = interpreter.get_output_details()[0]
+
+        img = np.asarray(img, dtype=np.float32)
+        if input_details["dtype"] == np.int8:
+            scale, zero_point = input_details["quantization"]
+            img = np.clip(np.round(img / scale + zero_point), -128, 127).astype(np.int8)
+
+        interpreter.set_tensor(input_details["index"], img)
+        interpreter.invoke()
+        output = interpreter.get_tensor(output_details["index"])
+
+        if output_details["dtype"] == np.int8:
+            scale, zero_point = output_details["quantization"]
+            output = (output.astype(np.float32) - zero_point) * scale
+        return output
+
+    def _build_inference_fn(self, interpreter: Optional[tf.lite.Interpreter], model: Optional[tf.keras.Model]) -> Callable[[np.ndarray], np.ndarray]:
+        """Build a single-image inference callable for the loaded classifier"""
+        if interpreter is not None:
+            return lambda img: self._run_interpreter(interpreter, img)
+
+        # Call the model directly through a traced graph instead of predict(),
+        # which sets up a full data pipeline for every single-image call
+        concrete_fn = tf.function(lambda x: model(x, training=False)).get_concrete_function(
+            tf.TensorSpec([1, 128, 128, 3], tf.float32)
+        )
+        return lambda img: concrete_fn(tf.convert_to_tensor(img, dtype=tf.float32)).numpy()
 
     def _load_model(self, model_name: str) -> tf.keras.Model:
         try:
@@ -58,11 +271,64 @@ class GeologicalEngine:
         model.save(self.models_dir / model_name)
         return model
 
+    def identify(self, image_path: str) -> Optional[Dict]:
+        """Identify a sample as mineral or rock from a single preprocessed image"""
+        return self._identify_with(image_path, self._mineral_fn, self._rock_fn)
+
+    def identify_batch(self, image_paths: Iterable[str]) -> List[Optional[Dict]]:
+        """Identify many samples concurrently, one pooled interpreter pair per worker thread"""
+        if self._interp_pool is None:
+            self._interp_pool = queue.Queue()
+            for _ in range(self._pool_size):
+                self._interp_pool.put((
+                    self._pooled_fn(self._mineral_tflite, self._mineral_fn),
+                    self._pooled_fn(self._rock_tflite, self._rock_fn)
+                ))
+        # Interpreters outlive the call, worker threads don't
+        with ThreadPoolExecutor(max_workers=self._pool_size) as executor:
+            return list(executor.map(self._identify_pooled, image_paths))
+
+    def _pooled_fn(self, model_content: Optional[bytes], shared_fn: Callable[[np.ndarray], np.ndarray]) -> Callable[[np.ndarray], np.ndarray]:
+        """Build a private single-threaded interpreter for one pool slot"""
+        if model_content is None:
+            return shared_fn  # The Keras fallback is safe to share between threads
+        # One thread per interpreter so concurrent invocations don't compete for cores
+        return self._build_inference_fn(self._make_interpreter(model_content, num_threads=1), None)
+
+    def _identify_pooled(self, image_path: str) -> Optional[Dict]:
+        fns = self._interp_pool.get()
+        try:
+            return self._identify_with(image_path, *fns)
+        finally:
+            self._interp_pool.put(fns)
+
+    def _identify_with(self, image_path: str, mineral_fn: Callable[[np.ndarray], np.ndarray],
+                       rock_fn: Callable[[np.ndarray], np.ndarray]) -> Optional[Dict]:
+        try:
+            img = self._preprocess_image(image_path)
+            mineral_pred = mineral_fn(img)[0]
+            rock_pred = rock_fn(img)[0]
+        except Exception as e:
+            print(f"Error identifying sample: {str(e)}")
+            return None
+
+        mineral_id, rock_id = int(np.argmax(mineral_pred)), int(np.argmax(rock_pred))
+        candidates = [
+            (mineral_pred[mineral_id], self.knowledge_base.get_mineral, self.mineral_classes.get(mineral_id, "Unknown")),
+            (rock_pred[rock_id], self.knowledge_base.get_rock, self.rock_classes.get(rock_id, "Unknown"))
+        ]
+        # Prefer the more confident classifier, falling back to the other one
+        for _, lookup, name in sorted(candidates, key=lambda c: c[0], reverse=True):
+            result = lookup(name)
+            if result:
+                return result
+        return None
+
     def identify_mineral(self, image_path: str) -> Optional[Dict]:
         """Identify mineral from image"""
         try:
             img = self._preprocess_image(image_path)
-            prediction = self.mineral_model.predict(img)
+            prediction = self._mineral_fn(img)
             class_id = np.argmax(prediction[0])
             mineral_name = self.mineral_classes.get(class_id, "Unknown")
             return self.knowledge_base.get_mineral(mineral_name)
@@ -74,7 +340,7 @@ class GeologicalEngine:
         """Identify rock from image"""
         try:
             img = self._preprocess_image(image_path)
-            prediction = self.rock_model.predict(img)
+            prediction = self._rock_fn(img)
             class_id = np.argmax(prediction[0])
             rock_name = self.rock_classes.get(class_id, "Unknown")
             return self.knowledge_base.get_rock(rock_name)
@@ -83,12 +349,9 @@ class GeologicalEngine:
             return None
 
     def _preprocess_image(self, image_path: str) -> np.ndarray:
-        """Preprocess image for model input"""
-        img = Image.open(image_path)
-        img = img.resize((128, 128))
-        img_array = tf.keras.preprocessing.image.img_to_array(img)
-        img_array = tf.expand_dims(img_array, 0)  # Create batch axis
-        return img_array / 255.0  # Normalize to [0,1]
+        """Preprocess image for model input, reusing cached results for unchanged files"""
+        stat = os.stat(image_path)
+        return _prep_cached(str(image_path), stat.st_mtime_ns, stat.st_size)
 
     def generate_geological_map(self, survey_data: Dict) -> str:
         """Generate 2D geological map from survey data"""
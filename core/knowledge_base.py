@@ -1,48 +1,100 @@
-import json
+from collections import defaultdict
+from functools import cached_property, lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
+from . import _json
+
+DATA_DIR = Path(__file__).resolve().parent.parent / "data"
+
+# Case-folded name index and lowered property values per property
+Indexes = Tuple[Dict[str, Dict], Dict[str, List[Tuple[str, Dict]]]]
+
+@lru_cache(maxsize=32)
+def _load_json(path_str: str, mtime_ns: int) -> Dict:
+    """Parse a JSON file once per modification time.
+
+    The result is shared by every caller and must not be mutated in place;
+    KnowledgeBase copies before adding entries.
+    """
+    return _json.loads(Path(path_str).read_bytes())
 
 class KnowledgeBase:
     def __init__(self):
-        self.data_dir = Path(__file__).parent.parent / "data"
-        self.minerals = self._load_data("minerals.json")
-        self.rocks = self._load_data("rocks.json")
-        self.formations = self._load_data("geological_formations.json")
+        self.data_dir = DATA_DIR
+
+    # Data files are only parsed when first used
+    @cached_property
+    def minerals(self) -> Dict:
+        return self._load_data("minerals.json")
+
+    @cached_property
+    def rocks(self) -> Dict:
+        return self._load_data("rocks.json")
+
+    @cached_property
+    def formations(self) -> Dict:
+        return self._load_data("geological_formations.json")
+
+    @cached_property
+    def _mineral_indexes(self) -> Indexes:
+        return self._build_indexes(self.minerals.get("minerals", []))
+
+    @cached_property
+    def _rock_indexes(self) -> Indexes:
+        return self._build_indexes(self.rocks.get("rocks", []))
 
     def _load_data(self, filename: str) -> Dict:
-        with open(self.data_dir / filename, 'r') as f:
-            return json.load(f)
+        path = self.data_dir / filename
+        return _load_json(str(path), path.stat().st_mtime_ns)
+
+    @classmethod
+    def _build_indexes(cls, items: List[Dict]) -> Indexes:
+        indexes = ({}, defaultdict(list))
+        cls._index_items(items, indexes)
+        return indexes
+
+    @staticmethod
+    def _index_items(items: List[Dict], indexes: Indexes) -> None:
+        name_idx, prop_idx = indexes
+        for item in items:
+            # Keep the first entry on duplicate names, matching the old linear scan
+            name_idx.setdefault(item["name"].casefold(), item)
+            for prop, value in item.items():
+                prop_idx[prop].append((str(value).lower(), item))
 
     def get_mineral(self, name: str) -> Optional[Dict]:
-        for mineral in self.minerals.get("minerals", []):
-            if mineral["name"].lower() == name.lower():
-                return mineral
-        return None
+        return self._mineral_indexes[0].get(name.casefold())
 
     def get_rock(self, name: str) -> Optional[Dict]:
-        for rock in self.rocks.get("rocks", []):
-            if rock["name"].lower() == name.lower():
-                return rock
-        return None
+        return self._rock_indexes[0].get(name.casefold())
 
     def search_by_property(self, property_name: str, value: str, search_type: str = "mineral") -> List[Dict]:
-        results = []
-        search_data = self.minerals if search_type == "mineral" else self.rocks
-        key = "minerals" if search_type == "mineral" else "rocks"
-        
-        for item in search_data.get(key, []):
-            if property_name in item and str(value).lower() in str(item[property_name]).lower():
-                results.append(item)
-        return results
+        _, prop_idx = self._mineral_indexes if search_type == "mineral" else self._rock_indexes
+        value = str(value).lower()
+        return [item for text, item in prop_idx.get(property_name, []) if value in text]
 
     def add_mineral(self, mineral_data: Dict) -> None:
-        self.minerals["minerals"].append(mineral_data)
-        self._save_data("minerals.json", self.minerals)
+        self.add_minerals([mineral_data])
 
     def add_rock(self, rock_data: Dict) -> None:
-        self.rocks["rocks"].append(rock_data)
+        self.add_rocks([rock_data])
+
+    def add_minerals(self, minerals: List[Dict]) -> None:
+        """Add several minerals with a single write of minerals.json"""
+        # Copy rather than extend the cached data, which other instances share
+        self.minerals = {**self.minerals, "minerals": self.minerals.get("minerals", []) + minerals}
+        # Indexes that haven't been built yet will pick the new entries up when they are
+        if "_mineral_indexes" in self.__dict__:
+            self._index_items(minerals, self._mineral_indexes)
+        self._save_data("minerals.json", self.minerals)
+
+    def add_rocks(self, rocks: List[Dict]) -> None:
+        """Add several rocks with a single write of rocks.json"""
+        self.rocks = {**self.rocks, "rocks": self.rocks.get("rocks", []) + rocks}
+        if "_rock_indexes" in self.__dict__:
+            self._index_items(rocks, self._rock_indexes)
         self._save_data("rocks.json", self.rocks)
 
     def _save_data(self, filename: str, data: Dict) -> None:
-        with open(self.data_dir / filename, 'w') as f:
-            json.dump(data, f, indent=4)
\ No newline at end of file
+        with open(self.data_dir / filename, 'wb') as f:
+            f.write(_json.dumps(data))
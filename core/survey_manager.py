@@ -1,27 +1,122 @@
-import json
+import os
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import Callable, List, Dict, Optional, Set
 from datetime import datetime
-import numpy as np
 from .knowledge_base import KnowledgeBase
+from . import _json
+import ahocorasick
 
 class SurveyManager:
-    def __init__(self):
+    # Number of logged operations after which the log is folded into the base file
+    COMPACT_THRESHOLD = 100
+
+    def __init__(self, surveys_dir: Optional[Path] = None):
         self.knowledge_base = KnowledgeBase()
-        self.surveys_dir = Path(__file__).parent.parent / "data" / "user_surveys"
+        self.surveys_dir = surveys_dir or Path(__file__).parent.parent / "data" / "user_surveys"
         self.surveys_dir.mkdir(exist_ok=True)
         self.survey_file = self.surveys_dir / "survey_records.json"
+        self.survey_log = self.surveys_dir / "survey_records.log.jsonl"
         self.surveys = self._load_surveys()
 
+        # Keyword rules for description inference, matched in a single pass
+        rules_file = self.knowledge_base.data_dir / "inference_rules.json"
+        self.inference_rules = _json.loads(rules_file.read_bytes())["rules"]
+        for rule in self.inference_rules:
+            # Descriptions are lowercased before matching, so keywords must be too
+            rule["any_of"] = [[kw.lower() for kw in group] for group in rule["any_of"]]
+        keywords = {kw for rule in self.inference_rules for group in rule["any_of"] for kw in group}
+        self._match_keywords = self._build_keyword_matcher(keywords)
+
+    @staticmethod
+    def _build_keyword_matcher(keywords: Set[str]) -> Callable[[str], Set[str]]:
+        """Build a function returning the keywords found anywhere in a text"""
+        if not keywords:
+            return lambda text: set()
+
+        automaton = ahocorasick.Automaton()
+        for keyword in keywords:
+            automaton.add_word(keyword, keyword)
+        automaton.make_automaton()
+        return lambda text: {keyword for _, keyword in automaton.iter(text)}
+
     def _load_surveys(self) -> Dict:
-        if not self.survey_file.exists():
-            return {"surveys": []}
-        with open(self.survey_file, 'r') as f:
-            return json.load(f)
+        surveys = {"surveys": []}
+        if self.survey_file.exists():
+            with open(self.survey_file, 'rb') as f:
+                surveys = _json.loads(f.read())
+
+        # Log records carry increasing sequence numbers; the base file remembers
+        # the last one it contains so a replay never applies an operation twice
+        self._log_seq = surveys.get("log_seq", 0)
+        replayed = self._replay_log(surveys)
+        if replayed >= self.COMPACT_THRESHOLD:
+            self.surveys = surveys
+            self.compact()
+        return surveys
+
+    def _replay_log(self, surveys: Dict) -> int:
+        """Apply operations from the append log to the loaded surveys"""
+        if not self.survey_log.exists():
+            return 0
+
+        data = self.survey_log.read_bytes()
+        end = data.rfind(b"\n") + 1
+        if end < len(data):
+            # Drop a partially written trailing record so later appends start on a fresh line
+            print(f"Discarding incomplete record at the end of {self.survey_log.name}")
+            with open(self.survey_log, 'r+b') as f:
+                f.truncate(end)
+            data = data[:end]
+
+        replayed = 0
+        index = {survey["id"]: survey for survey in surveys["surveys"]}
+        for line in data.splitlines():
+            try:
+                record = _json.loads(line)
+            except ValueError:
+                print(f"Skipping unreadable record in {self.survey_log.name}")
+                continue
+            seq = record.get("seq", 0)
+            if seq and seq <= self._log_seq:
+                continue  # Already folded into the base file
+            if record.get("op") == "create" and record["survey"]["id"] not in index:
+                surveys["surveys"].append(record["survey"])
+                index[record["survey"]["id"]] = record["survey"]
+            elif record.get("op") == "add_desc" and record.get("id") in index:
+                index[record["id"]]["descriptions"].append(record["entry"])
+            else:
+                continue
+            self._log_seq = max(self._log_seq, seq)
+            replayed += 1
+        return replayed
+
+    def _append_log(self, record: Dict) -> None:
+        self._log_seq += 1
+        line = _json.dumps({"seq": self._log_seq, **record}, indent=False)
+        with open(self.survey_log, 'a+b') as f:
+            # Never continue a line left unterminated by an interrupted write
+            if f.seek(0, os.SEEK_END) > 0:
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b"\n":
+                    line = b"\n" + line
+            f.write(line)
 
     def _save_surveys(self) -> None:
-        with open(self.survey_file, 'w') as f:
-            json.dump(self.surveys, f, indent=4)
+        """Atomically replace the base survey file"""
+        self.surveys["log_seq"] = self._log_seq
+        tmp_file = self.survey_file.with_name(self.survey_file.name + ".tmp")
+        with open(tmp_file, 'wb') as f:
+            f.write(_json.dumps(self.surveys))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_file, self.survey_file)
+
+    def compact(self) -> None:
+        """Rewrite the base survey file and truncate the append log"""
+        # If we stop between these steps, log_seq in the base file stops the
+        # remaining log records from being replayed again
+        self._save_surveys()
+        self.survey_log.unlink(missing_ok=True)
 
     def create_survey(self, coordinates: List[Dict], formation: str = None) -> str:
         """Create a new survey and return its ID"""
@@ -34,7 +129,7 @@ class SurveyManager:
             "date": datetime.now().strftime("%Y-%m-%d")
         }
         self.surveys["surveys"].append(new_survey)
-        self._save_surveys()
+        self._append_log({"op": "create", "survey": new_survey})
         return survey_id
 
     def add_description(self, survey_id: str, description: str, location_index: int = 0) -> Optional[Dict]:
@@ -51,7 +146,7 @@ class SurveyManager:
         }
         
         survey["descriptions"].append(desc_entry)
-        self._save_surveys()
+        self._append_log({"op": "add_desc", "id": survey_id, "entry": desc_entry})
         
         if inferred_type:
             return self._get_type_details(inferred_type)
@@ -66,17 +161,12 @@ class SurveyManager:
     def infer_type_from_description(self, description: str) -> Optional[str]:
         """Use NLP to infer rock/mineral type from description"""
         # In a real implementation, this would use a trained NLP model
-        description = description.lower()
-        
-        # Simple keyword matching (would be replaced with ML model)
-        if "granite" in description or ("coarse" in description and "feldspar" in description):
-            return "Granite"
-        elif "basalt" in description or ("fine" in description and "volcanic" in description):
-            return "Basalt"
-        elif "quartz" in description and "clear" in description:
-            return "Quartz"
-        elif "limestone" in description or ("reacts" in description and "acid" in description):
-            return "Limestone"
+        matches = self._match_keywords(description.lower())
+
+        # Simple keyword rules (would be replaced with ML model), checked in order
+        for rule in self.inference_rules:
+            if any(matches.issuperset(group) for group in rule["any_of"]):
+                return rule["type"]
         return None
 
     def _get_type_details(self, type_name: str) -> Dict:
@@ -0,0 +1,87 @@
+import contextlib
+import io
+import shutil
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+import numpy as np
+from PIL import Image
+from core import geological_engine
+from core.geological_engine import GeologicalEngine
+
+class TestGeologicalEngine(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # Placeholder models and their TFLite conversions are built once in a scratch directory
+        cls.tmp_dir = Path(tempfile.mkdtemp())
+        cls.engine = GeologicalEngine(models_dir=cls.tmp_dir / "models")
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.tmp_dir)
+
+    def _make_images(self, count):
+        rng = np.random.default_rng(1)
+        paths = []
+        for i in range(count):
+            path = self.tmp_dir / f"sample_{i}.png"
+            Image.fromarray(rng.integers(0, 256, (64, 64, 3), dtype=np.uint8)).save(path)
+            paths.append(str(path))
+        return paths
+
+    def test_identify_batch_matches_identify(self):
+        paths = self._make_images(6)
+        self.assertEqual(self.engine.identify_batch(paths), [self.engine.identify(p) for p in paths])
+
+    def test_identify_batch_reuses_pool(self):
+        paths = self._make_images(2)
+        self.engine.identify_batch(paths)
+        self.assertEqual(self.engine._interp_pool.qsize(), self.engine._pool_size)
+        self.assertEqual(len(self.engine.identify_batch(paths)), 2)
+
+    def test_interpreter_without_xnnpack_is_silent(self):
+        output, unraisable = io.StringIO(), []
+        with mock.patch.object(GeologicalEngine, "_xnnpack_available", None), \
+                mock.patch.object(geological_engine, "XNNPACK_DELEGATE_LIB", "libmissing_delegate.so"), \
+                mock.patch.object(sys, "unraisablehook", unraisable.append), \
+                contextlib.redirect_stdout(output), contextlib.redirect_stderr(output):
+            interpreter = GeologicalEngine._make_interpreter(self.engine._mineral_tflite)
+            self.assertFalse(GeologicalEngine._xnnpack_available)
+        self.assertEqual(output.getvalue(), "")
+        self.assertEqual(unraisable, [])
+
+        input_details = interpreter.get_input_details()[0]
+        interpreter.set_tensor(input_details["index"], np.zeros(input_details["shape"], input_details["dtype"]))
+        interpreter.invoke()
+        self.assertEqual(interpreter.get_output_details()[0]["shape"].tolist(), [1, 4])
+
+    def _preprocess_with_sidecar(self, path):
+        geological_engine._prep_cached.cache_clear()
+        with mock.patch.object(geological_engine, "SIDECAR_MIN_BYTES", 0):
+            return self.engine._preprocess_image(path)
+
+    def test_sidecar_round_trip(self):
+        path = self._make_images(1)[0]
+        first = self._preprocess_with_sidecar(path)
+        self.assertTrue(Path(path + geological_engine.SIDECAR_SUFFIX).exists())
+        np.testing.assert_array_equal(self._preprocess_with_sidecar(path), first)
+
+    def test_sidecar_rebuilt_when_source_changes(self):
+        path = self._make_images(1)[0]
+        self._preprocess_with_sidecar(path)
+        Image.new("RGB", (64, 64), (255, 255, 255)).save(path)
+        self.assertTrue(np.all(self._preprocess_with_sidecar(path) == 1.0))
+
+    def test_sidecar_with_wrong_shape_is_ignored(self):
+        path = self._make_images(1)[0]
+        stat = Path(path).stat()
+        np.savez(path + geological_engine.SIDECAR_SUFFIX, image=np.zeros((1, 64, 64, 3), np.float32),
+                 source=np.array([stat.st_size, stat.st_mtime_ns]))
+        img = self._preprocess_with_sidecar(path)
+        self.assertEqual(img.shape, geological_engine.INPUT_SHAPE)
+        self.assertEqual(img.dtype, np.float32)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,43 @@
+import shutil
+import tempfile
+import unittest
+import unittest.mock
+from pathlib import Path
+from core.knowledge_base import DATA_DIR, KnowledgeBase
+
+class TestKnowledgeBase(unittest.TestCase):
+    def setUp(self):
+        self.data_dir = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.data_dir)
+        for filename in ("minerals.json", "rocks.json", "geological_formations.json"):
+            shutil.copy(DATA_DIR / filename, self.data_dir)
+
+    def _kb(self):
+        kb = KnowledgeBase()
+        kb.data_dir = self.data_dir
+        return kb
+
+    def test_lookup_is_case_insensitive(self):
+        kb = self._kb()
+        self.assertEqual(kb.get_mineral("CALCITE")["name"], "Calcite")
+        self.assertEqual(kb.get_rock("granite")["name"], "Granite")
+
+    def test_added_entries_do_not_leak_into_other_instances(self):
+        a, b = self._kb(), self._kb()
+        b.get_rock("granite")  # Load b from the shared cache before a writes
+        a.add_rock({"name": "Shale", "type": "Sedimentary"})
+
+        self.assertEqual(a.get_rock("shale")["name"], "Shale")
+        self.assertNotIn("Shale", [rock["name"] for rock in b.rocks["rocks"]])
+        self.assertEqual(self._kb().get_rock("shale")["name"], "Shale")
+
+    def test_failed_save_does_not_change_cached_data(self):
+        kb = self._kb()
+        kb.get_rock("granite")
+        kb._save_data = unittest.mock.Mock(side_effect=OSError("disk full"))
+        with self.assertRaises(OSError):
+            kb.add_rocks([{"name": "Slate"}])
+        self.assertIsNone(self._kb().get_rock("slate"))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,4 +1,5 @@
 import unittest
+import numpy as np
 from utils.map_generator import MapGenerator
 
 class TestMapGenerator(unittest.TestCase):
@@ -17,5 +18,31 @@ class TestMapGenerator(unittest.TestCase):
         fig = self.generator.generate_detailed_map(self.test_data)
         self.assertIsNotNone(fig)
 
+    def test_map_creation_from_arrays(self):
+        array_data = {
+            "coordinates": np.array([[-118.0, 34.0, 100.0], [-118.1, 34.1, 200.0]]),
+            "units": [{
+                "type": "granite",
+                "coordinates": np.array([[-118.0, 34.0], [-118.1, 34.0], [-118.1, 34.1]])
+            }],
+            "structural_features": [{
+                "type": "fault",
+                "coordinates": np.array([[-118.0, 34.0, 100.0], [-118.1, 34.1, 200.0]]),
+                "displacement": 100.0
+            }]
+        }
+        fig = self.generator.generate_detailed_map(array_data)
+        self.assertIsNotNone(fig)
+
+    def test_fault_label_format(self):
+        ax = self.generator._ax
+        ax.clear()
+        coords = np.array([[-118.0, 34.0, 100.0], [-118.1, 34.1, 400.0]])
+        for displacement, label in ((300.0, "Fault (300m)"), (12.5, "Fault (12.5m)"), (None, "Fault (?m)")):
+            self.generator._plot_structural_feature(ax, {
+                "type": "fault", "coordinates": coords, "displacement": displacement
+            })
+            self.assertEqual(ax.texts[-1].get_text(), label)
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
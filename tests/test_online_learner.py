@@ -0,0 +1,88 @@
+import asyncio
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+import httpx
+from core.knowledge_base import DATA_DIR
+from utils import online_learner
+from utils.online_learner import OnlineLearner
+
+MINERALS_PAGE = """<html><body>
+<table class="wikitable sortable">
+  <tr><th>Name</th><th>Description</th></tr>
+  <tr><td>Olivine</td><td>Magnesium iron silicate</td></tr>
+  <tr><td>Garnet</td><td>Nesosilicate group</td></tr>
+</table>
+<table class="infobox"><tr><td>Not</td><td>a mineral</td></tr></table>
+</body></html>"""
+
+ROCKS_PAGE = """<html><body>
+<table class="wikitable">
+  <tr><th>Name</th><th>Type</th><th>Description</th></tr>
+  <tr><td>Gneiss</td><td>Metamorphic</td><td>Banded</td></tr>
+</table>
+</body></html>"""
+
+class TestOnlineLearner(unittest.TestCase):
+    def _learner(self, pages):
+        """Build a learner whose sources[i] serves pages[i]; other sources fail to connect"""
+        def handler(request):
+            index = learner.sources.index(str(request.url))
+            if index not in pages:
+                raise httpx.ConnectError("unreachable", request=request)
+            return httpx.Response(200, text=pages[index])
+
+        learner = OnlineLearner(transport=httpx.MockTransport(handler))
+        return learner
+
+    def _with_scratch_data(self, learner):
+        """Point the learner's knowledge base at a copy of the data files and count its writes"""
+        data_dir = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, data_dir)
+        for filename in ("minerals.json", "rocks.json"):
+            shutil.copy(DATA_DIR / filename, data_dir)
+        kb = learner.knowledge_base
+        kb.data_dir = data_dir
+        kb._save_data = mock.Mock(wraps=kb._save_data)
+        return kb
+
+    def test_scrape_all_parses_both_sources(self):
+        learner = self._learner({0: MINERALS_PAGE, 1: ROCKS_PAGE})
+        with mock.patch.object(online_learner, "BeautifulSoup", wraps=online_learner.BeautifulSoup) as soup:
+            minerals, rocks = asyncio.run(learner._scrape_all())
+
+        self.assertEqual([call.args[1] for call in soup.call_args_list], ["lxml", "lxml"])
+        self.assertEqual(minerals, [
+            {"name": "Olivine", "description": "Magnesium iron silicate"},
+            {"name": "Garnet", "description": "Nesosilicate group"}
+        ])
+        self.assertEqual(rocks, [{"name": "Gneiss", "type": "Metamorphic", "description": "Banded"}])
+
+    def test_failing_source_keeps_the_other(self):
+        learner = self._learner({1: ROCKS_PAGE})
+        with mock.patch("builtins.print"):
+            minerals, rocks = asyncio.run(learner._scrape_all())
+
+        self.assertEqual(minerals, [])
+        self.assertEqual([rock["name"] for rock in rocks], ["Gneiss"])
+
+    def test_update_writes_each_file_once(self):
+        learner = self._learner({0: MINERALS_PAGE, 1: ROCKS_PAGE})
+        kb = self._with_scratch_data(learner)
+        learner.update_knowledge_base()
+
+        self.assertEqual([call.args[0] for call in kb._save_data.call_args_list], ["minerals.json", "rocks.json"])
+        self.assertEqual(kb.get_mineral("garnet")["name"], "Garnet")
+        self.assertEqual(kb.get_rock("gneiss")["type"], "Metamorphic")
+
+    def test_update_skips_write_when_nothing_scraped(self):
+        learner = self._learner({})
+        kb = self._with_scratch_data(learner)
+        with mock.patch("builtins.print"):
+            learner.update_knowledge_base()
+        kb._save_data.assert_not_called()
+
+if __name__ == '__main__':
+    unittest.main()
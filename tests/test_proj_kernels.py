@@ -0,0 +1,55 @@
+import unittest
+from pathlib import Path
+import numpy as np
+from pyproj import Transformer
+from utils import _proj_kernels
+from utils.map_generator import MapGenerator
+
+# (lon, lat) survey points: Los Angeles (UTM 11N) and Cape Town (UTM 34S)
+LOS_ANGELES = (-118.2437, 34.0522)
+CAPE_TOWN = (18.4241, -33.9249)
+
+class TestProjKernels(unittest.TestCase):
+    def _project(self, projection, point, zone=0, south=False):
+        lon, lat = np.array([point[0]]), np.array([point[1]])
+        x, y = _proj_kernels.project(projection, lon, lat, zone, south)
+        return x[0], y[0]
+
+    def _pyproj(self, crs, point):
+        return Transformer.from_crs("EPSG:4326", crs, always_xy=True).transform(*point)
+
+    def test_utm_zone(self):
+        self.assertEqual(_proj_kernels.utm_zone(*LOS_ANGELES), (11, False))
+        self.assertEqual(_proj_kernels.utm_zone(*CAPE_TOWN), (34, True))
+
+    def test_utm_matches_pyproj(self):
+        for point, crs in ((LOS_ANGELES, "EPSG:32611"), (CAPE_TOWN, "EPSG:32734")):
+            with self.subTest(crs=crs):
+                zone, south = _proj_kernels.utm_zone(*point)
+                np.testing.assert_allclose(
+                    self._project("utm", point, zone, south), self._pyproj(crs, point), atol=0.01
+                )
+
+    def test_webmercator_matches_pyproj(self):
+        for point in (LOS_ANGELES, CAPE_TOWN):
+            np.testing.assert_allclose(
+                self._project("webmercator", point), self._pyproj("EPSG:3857", point), atol=0.01
+            )
+
+    def test_unsupported_projection(self):
+        with self.assertRaises(ValueError):
+            _proj_kernels.project("lambert", np.zeros(1), np.zeros(1))
+
+    def test_projected_map(self):
+        generator = MapGenerator(projection="utm")
+        survey_data = {
+            "id": "projection_test",
+            "coordinates": np.array([[-118.2437, 34.0522, 71.0], [-118.2447, 34.0532, 75.0]])
+        }
+        path = generator.generate_detailed_map(survey_data)
+        self.assertIsNotNone(path)
+        self.addCleanup(Path(path).unlink)
+        self.assertEqual(generator._utm_zone, (11, False))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,98 @@
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+from pathlib import Path
+from core.survey_manager import SurveyManager
+
+class TestSurveyManager(unittest.TestCase):
+    def setUp(self):
+        self.surveys_dir = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.surveys_dir)
+        self.manager = SurveyManager(self.surveys_dir)
+        self.survey_id = self.manager.create_survey([{"lat": 34.0, "lon": -118.0, "elevation": 100}])
+
+    def _descriptions(self):
+        return [d["text"] for d in SurveyManager(self.surveys_dir)._get_survey(self.survey_id)["descriptions"]]
+
+    def test_log_is_replayed_on_load(self):
+        self.manager.add_description(self.survey_id, "Coarse granite")
+        self.assertEqual(self._descriptions(), ["Coarse granite"])
+        self.assertFalse(self.manager.survey_file.exists())
+
+    def test_torn_record_does_not_swallow_later_appends(self):
+        self.manager.add_description(self.survey_id, "first")
+        with open(self.manager.survey_log, 'ab') as f:
+            f.write(b'{"seq": 99, "op": "add_desc", "id": "surv')
+
+        # Appending without reloading must start a new line
+        self.manager.add_description(self.survey_id, "second")
+        self.assertEqual(self._descriptions(), ["first", "second"])
+
+        # Reloading repairs the log before the next append
+        with open(self.manager.survey_log, 'ab') as f:
+            f.write(b'{"seq": 99, "op"')
+        manager = SurveyManager(self.surveys_dir)
+        self.assertTrue(manager.survey_log.read_bytes().endswith(b"\n"))
+        manager.add_description(self.survey_id, "third")
+        self.assertEqual(self._descriptions(), ["first", "second", "third"])
+
+    def test_compact_folds_log_into_base_file(self):
+        self.manager.add_description(self.survey_id, "basalt")
+        self.manager.compact()
+        self.assertFalse(self.manager.survey_log.exists())
+        self.assertEqual(self._descriptions(), ["basalt"])
+
+        self.manager.add_description(self.survey_id, "limestone")
+        self.assertEqual(self._descriptions(), ["basalt", "limestone"])
+
+    def test_interrupted_compaction_does_not_duplicate_records(self):
+        self.manager.add_description(self.survey_id, "basalt")
+        self.manager._save_surveys()  # Simulate a crash before the log is removed
+        self.assertTrue(self.manager.survey_log.exists())
+
+        manager = SurveyManager(self.surveys_dir)
+        self.assertEqual(len(manager.surveys["surveys"]), 1)
+        self.assertEqual(self._descriptions(), ["basalt"])
+
+    @mock.patch.object(SurveyManager, "COMPACT_THRESHOLD", 3)
+    def test_compacts_automatically_past_threshold(self):
+        for i in range(3):
+            self.manager.add_description(self.survey_id, f"note {i}")
+
+        manager = SurveyManager(self.surveys_dir)
+        self.assertFalse(manager.survey_log.exists())
+        self.assertEqual(self._descriptions(), ["note 0", "note 1", "note 2"])
+
+    def test_infers_types_like_the_original_keyword_rules(self):
+        cases = {
+            "Pink granite outcrop": "Granite",
+            "Coarse-grained rock with feldspar": "Granite",
+            "Dark basalt flow": "Basalt",
+            "Fine-grained volcanic rock": "Basalt",
+            "Clear quartz crystals": "Quartz",
+            "Grey limestone bed": "Limestone",
+            "Rock reacts with dilute acid": "Limestone",
+            "Coarse sandstone": None,
+            "Milky quartz vein": None,
+        }
+        for description, expected in cases.items():
+            with self.subTest(description=description):
+                self.assertEqual(self.manager.infer_type_from_description(description), expected)
+
+    def test_keyword_matcher_finds_overlapping_keywords(self):
+        match = SurveyManager._build_keyword_matcher({"acid", "acidic"})
+        self.assertEqual(match("acidic soil"), {"acid", "acidic"})
+
+    def test_rule_keywords_are_case_insensitive(self):
+        data_dir = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, data_dir)
+        (data_dir / "inference_rules.json").write_text(
+            '{"rules": [{"type": "Granite", "any_of": [["Coarse", "Feldspar"]]}]}'
+        )
+        with mock.patch("core.knowledge_base.DATA_DIR", data_dir):
+            manager = SurveyManager(self.surveys_dir)
+        self.assertEqual(manager.infer_type_from_description("coarse FELDSPAR grains"), "Granite")
+
+if __name__ == '__main__':
+    unittest.main()
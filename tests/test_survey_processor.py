@@ -0,0 +1,51 @@
+import unittest
+from unittest import mock
+import numpy as np
+from utils import _geo_kernels
+from utils.survey_processor import SurveyProcessor
+
+class TestSurveyProcessor(unittest.TestCase):
+    def setUp(self):
+        self.processor = SurveyProcessor()
+        self.survey_data = {
+            "coordinates": [
+                {"lat": 34.0, "lon": -118.0, "elevation": 100},
+                {"lat": 34.1, "lon": -118.1, "elevation": 120},
+                {"lat": 34.2, "lon": -118.2, "elevation": 300}
+            ],
+            "units": [
+                {"type": "Granite", "coordinates": [{"lat": 34.0, "lon": -118.0, "elevation": 100}]},
+                {"type": "Basalt", "coordinates": [{"lat": 34.2, "lon": -118.2, "elevation": 300}]}
+            ]
+        }
+
+    def test_kernels_match_numpy(self):
+        starts = np.array([[0.0, 1.0, 2.0], [-5.0, 3.0, 10.0]])
+        ends = np.array([[1.0, 3.0, 6.0], [5.0, -3.0, 0.0]])
+        elev = np.array([100.0, 120.0, 300.0, 290.0])
+        # A zero threshold routes even these small inputs through the Numba kernels
+        for min_size in (_geo_kernels.NUMBA_MIN_POINTS, 0):
+            with self.subTest(min_size=min_size):
+                with mock.patch.multiple(_geo_kernels, NUMBA_MIN_POINTS=min_size, PARALLEL_MIN_UNITS=min_size):
+                    np.testing.assert_allclose(
+                        _geo_kernels.interpolate_many(starts, ends, 5),
+                        np.linspace(starts, ends, 5, axis=1)
+                    )
+                    idx, jump = _geo_kernels.max_elev_jump(elev)
+                self.assertEqual((idx, jump), (1, 180.0))
+
+    def test_boundaries_and_faults(self):
+        processed = self.processor.process_survey_data(self.survey_data)
+
+        boundary = processed["boundaries"][0]
+        self.assertEqual(boundary["between"], ["Granite", "Basalt"])
+        np.testing.assert_allclose(boundary["coordinates"][[0, -1]], [[-118.0, 34.0, 100], [-118.2, 34.2, 300]])
+
+        fault = processed["structural_features"][0]
+        self.assertEqual(fault["displacement"], 180.0)
+        np.testing.assert_allclose(fault["coordinates"][:, 2], [120, 300])
+        self.assertEqual(processed["coordinates"].shape, (3, 3))
+        self.assertEqual(processed["units"][0]["coordinates"].shape, (1, 2))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,18 @@
+"""Conversion of survey coordinate dicts to the lon, lat, elevation arrays used downstream"""
+from typing import Dict, List, Union
+
+import numpy as np
+
+
+def coords_to_array(coords: Union[np.ndarray, List[Dict]]) -> np.ndarray:
+    """Return coordinates as a float64 array with lon, lat[, elevation] columns.
+
+    Arrays are returned unchanged; lists of {lat, lon, elevation} dicts become
+    a contiguous (N, 3) array, with a missing elevation read as 0.
+    """
+    if isinstance(coords, np.ndarray):
+        return coords
+    return np.array(
+        [(c["lon"], c["lat"], c.get("elevation", 0)) for c in coords],
+        dtype=np.float64
+    ).reshape(-1, 3)
@@ -0,0 +1,68 @@
+"""Numeric kernels for survey geometry.
+
+NumPy implementations are used by default. Numba is only imported, and its
+kernels compiled, for inputs large enough to repay the JIT cost.
+"""
+from typing import Optional
+
+import numpy as np
+
+# Below these sizes importing and compiling Numba costs more than it saves
+NUMBA_MIN_POINTS = 100_000
+PARALLEL_MIN_UNITS = 1_000
+
+# Compiled Numba kernels, built on first use so importing numba is deferred
+_numba_kernels: Optional[dict] = None
+
+
+def _get_numba_kernels() -> Optional[dict]:
+    """Compile the Numba kernels on first use, or return None without Numba"""
+    global _numba_kernels
+    if _numba_kernels is None:
+        _numba_kernels = {}
+        try:
+            from numba import njit, prange
+        except ImportError:  # pragma: no cover - depends on installed packages
+            return None
+
+        @njit(parallel=True, cache=True)
+        def interpolate_many_jit(starts, ends, n):
+            out = np.empty((starts.shape[0], n, starts.shape[1]))
+            for i in prange(starts.shape[0]):
+                for k in range(n):
+                    t = k / (n - 1) if n > 1 else 0.0
+                    for j in range(starts.shape[1]):
+                        out[i, k, j] = starts[i, j] + t * (ends[i, j] - starts[i, j])
+                if n > 1:
+                    out[i, n - 1, :] = ends[i]
+            return out
+
+        @njit(cache=True)
+        def max_elev_jump_jit(elev):
+            best_idx, best = 0, -1.0
+            for i in range(elev.shape[0] - 1):
+                jump = abs(elev[i + 1] - elev[i])
+                if jump > best:
+                    best_idx, best = i, jump
+            return best_idx, best
+
+        _numba_kernels.update(interpolate_many=interpolate_many_jit, max_elev_jump=max_elev_jump_jit)
+    return _numba_kernels or None
+
+
+def interpolate_many(starts: np.ndarray, ends: np.ndarray, n: int) -> np.ndarray:
+    """Interpolate each row of starts to the same row of ends as an (m, n, d) array"""
+    kernels = _get_numba_kernels() if starts.shape[0] >= PARALLEL_MIN_UNITS else None
+    if kernels is not None:
+        return kernels["interpolate_many"](starts, ends, n)
+    return np.linspace(starts, ends, n, axis=1)
+
+
+def max_elev_jump(elev: np.ndarray):
+    """Return (index, size) of the largest absolute change between neighbouring elevations"""
+    kernels = _get_numba_kernels() if elev.size >= NUMBA_MIN_POINTS else None
+    if kernels is not None:
+        return kernels["max_elev_jump"](elev)
+    jumps = np.abs(np.diff(elev))
+    idx = int(np.argmax(jumps))
+    return idx, jumps[idx]
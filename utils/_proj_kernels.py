@@ -0,0 +1,194 @@
+"""WGS84 -> Web Mercator / UTM projection kernels.
+
+Compiled with Numba for the CPU when installed, with CUDA twins used for
+large inputs when a GPU is available. Without Numba, equivalent NumPy code
+is used. CRS pairs not covered here should go through pyproj.
+"""
+import math
+from typing import Optional, Tuple
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # pragma: no cover - depends on installed packages
+    njit = None
+
+# WGS84 ellipsoid
+R = 6378137.0
+F = 1 / 298.257223563
+E2 = F * (2 - F)
+EP2 = E2 / (1 - E2)
+
+# Web Mercator is undefined at the poles; clamp like EPSG:3857 does
+MAX_LAT = 85.051128779807
+
+# UTM parameters and meridian arc series coefficients (Snyder, 1987)
+K0 = 0.9996
+FALSE_EASTING = 500000.0
+FALSE_NORTHING_SOUTH = 10000000.0
+M1 = 1 - E2 / 4 - 3 * E2 ** 2 / 64 - 5 * E2 ** 3 / 256
+M2 = 3 * E2 / 8 + 3 * E2 ** 2 / 32 + 45 * E2 ** 3 / 1024
+M3 = 15 * E2 ** 2 / 256 + 45 * E2 ** 3 / 1024
+M4 = 35 * E2 ** 3 / 3072
+
+# Below this many points the GPU transfer costs more than it saves
+GPU_MIN_POINTS = 100_000
+
+
+def utm_zone(lon: float, lat: float) -> Tuple[int, bool]:
+    """Return the UTM zone number and southern-hemisphere flag for a point"""
+    zone = int((lon + 180) // 6) % 60 + 1
+    return zone, lat < 0
+
+
+def _webmerc_xy(lon, lat):
+    lat = min(max(lat, -MAX_LAT), MAX_LAT)
+    x = R * math.radians(lon)
+    y = R * math.log(math.tan(math.pi / 4 + math.radians(lat) / 2))
+    return x, y
+
+
+def _utm_xy(lon, lat, zone, south):
+    phi = math.radians(lat)
+    lon0 = math.radians((zone - 1) * 6 - 180 + 3)
+    sin_phi, cos_phi, tan_phi = math.sin(phi), math.cos(phi), math.tan(phi)
+
+    n = R / math.sqrt(1 - E2 * sin_phi * sin_phi)
+    t = tan_phi * tan_phi
+    c = EP2 * cos_phi * cos_phi
+    a = cos_phi * (math.radians(lon) - lon0)
+    m = R * (M1 * phi - M2 * math.sin(2 * phi) + M3 * math.sin(4 * phi) - M4 * math.sin(6 * phi))
+
+    x = K0 * n * (
+        a
+        + (1 - t + c) * a ** 3 / 6
+        + (5 - 18 * t + t * t + 72 * c - 58 * EP2) * a ** 5 / 120
+    ) + FALSE_EASTING
+    y = K0 * (m + n * tan_phi * (
+        a * a / 2
+        + (5 - t + 9 * c + 4 * c * c) * a ** 4 / 24
+        + (61 - 58 * t + t * t + 600 * c - 330 * EP2) * a ** 6 / 720
+    ))
+    if south:
+        y += FALSE_NORTHING_SOUTH
+    return x, y
+
+
+if njit is not None:
+    _webmerc_xy_cpu = njit(cache=True)(_webmerc_xy)
+    _utm_xy_cpu = njit(cache=True)(_utm_xy)
+
+    @njit(cache=True)
+    def wgs84_to_webmerc(lon, lat, out_x, out_y):
+        """Project lon/lat arrays to Web Mercator, filling out_x/out_y in place"""
+        for i in range(lon.size):
+            x, y = _webmerc_xy_cpu(lon[i], lat[i])
+            out_x[i] = x
+            out_y[i] = y
+
+    @njit(cache=True)
+    def wgs84_to_utm(lon, lat, zone, south, out_x, out_y):
+        """Project lon/lat arrays to a UTM zone, filling out_x/out_y in place"""
+        for i in range(lon.size):
+            x, y = _utm_xy_cpu(lon[i], lat[i], zone, south)
+            out_x[i] = x
+            out_y[i] = y
+
+else:
+    def wgs84_to_webmerc(lon, lat, out_x, out_y):
+        """Project lon/lat arrays to Web Mercator, filling out_x/out_y in place"""
+        lat = np.clip(lat, -MAX_LAT, MAX_LAT)
+        out_x[:] = R * np.radians(lon)
+        out_y[:] = R * np.log(np.tan(np.pi / 4 + np.radians(lat) / 2))
+
+    def wgs84_to_utm(lon, lat, zone, south, out_x, out_y):
+        """Project lon/lat arrays to a UTM zone, filling out_x/out_y in place"""
+        phi = np.radians(lat)
+        lon0 = math.radians((zone - 1) * 6 - 180 + 3)
+        sin_phi, cos_phi, tan_phi = np.sin(phi), np.cos(phi), np.tan(phi)
+
+        n = R / np.sqrt(1 - E2 * sin_phi * sin_phi)
+        t = tan_phi * tan_phi
+        c = EP2 * cos_phi * cos_phi
+        a = cos_phi * (np.radians(lon) - lon0)
+        m = R * (M1 * phi - M2 * np.sin(2 * phi) + M3 * np.sin(4 * phi) - M4 * np.sin(6 * phi))
+
+        out_x[:] = K0 * n * (
+            a
+            + (1 - t + c) * a ** 3 / 6
+            + (5 - 18 * t + t * t + 72 * c - 58 * EP2) * a ** 5 / 120
+        ) + FALSE_EASTING
+        out_y[:] = K0 * (m + n * tan_phi * (
+            a * a / 2
+            + (5 - t + 9 * c + 4 * c * c) * a ** 4 / 24
+            + (61 - 58 * t + t * t + 600 * c - 330 * EP2) * a ** 6 / 720
+        ))
+        if south:
+            out_y += FALSE_NORTHING_SOUTH
+
+
+# Compiled CUDA kernels, built on first use so importing numba.cuda is deferred
+_gpu_kernels: Optional[dict] = None
+
+
+def _get_gpu_kernels() -> Optional[dict]:
+    """Compile the CUDA kernels on first use, or return None without a usable GPU"""
+    global _gpu_kernels
+    if _gpu_kernels is None:
+        _gpu_kernels = {}
+        try:
+            from numba import cuda
+        except ImportError:  # pragma: no cover - depends on installed packages
+            return None
+        if not cuda.is_available():
+            return None
+
+        webmerc_xy_gpu = cuda.jit(device=True)(_webmerc_xy)
+        utm_xy_gpu = cuda.jit(device=True)(_utm_xy)
+
+        @cuda.jit
+        def wgs84_to_webmerc_gpu(lon, lat, out_x, out_y):
+            i = cuda.grid(1)
+            if i < lon.size:
+                x, y = webmerc_xy_gpu(lon[i], lat[i])
+                out_x[i] = x
+                out_y[i] = y
+
+        @cuda.jit
+        def wgs84_to_utm_gpu(lon, lat, zone, south, out_x, out_y):
+            i = cuda.grid(1)
+            if i < lon.size:
+                x, y = utm_xy_gpu(lon[i], lat[i], zone, south)
+                out_x[i] = x
+                out_y[i] = y
+
+        _gpu_kernels.update(cuda=cuda, webmercator=wgs84_to_webmerc_gpu, utm=wgs84_to_utm_gpu)
+    return _gpu_kernels or None
+
+
+def project(projection: str, lon: np.ndarray, lat: np.ndarray,
+            zone: int = 0, south: bool = False) -> Tuple[np.ndarray, np.ndarray]:
+    """Project contiguous float64 lon/lat arrays to 'webmercator' or 'utm' (x, y) arrays"""
+    if projection not in ("webmercator", "utm"):
+        raise ValueError(f"Unsupported projection: {projection}")
+
+    gpu = _get_gpu_kernels() if lon.size >= GPU_MIN_POINTS and njit is not None else None
+    if gpu is not None:
+        cuda = gpu["cuda"]
+        threads = 256
+        blocks = (lon.size + threads - 1) // threads
+        d_lon, d_lat = cuda.to_device(lon), cuda.to_device(lat)
+        d_x, d_y = cuda.device_array_like(lon), cuda.device_array_like(lat)
+        if projection == "webmercator":
+            gpu["webmercator"][blocks, threads](d_lon, d_lat, d_x, d_y)
+        else:
+            gpu["utm"][blocks, threads](d_lon, d_lat, zone, south, d_x, d_y)
+        return d_x.copy_to_host(), d_y.copy_to_host()
+
+    out_x, out_y = np.empty_like(lon), np.empty_like(lat)
+    if projection == "webmercator":
+        wgs84_to_webmerc(lon, lat, out_x, out_y)
+    else:
+        wgs84_to_utm(lon, lat, zone, south, out_x, out_y)
+    return out_x, out_y
@@ -2,14 +2,24 @@ import matplotlib
 matplotlib.use('Agg')  # Set non-interactive backend
 import matplotlib.pyplot as plt
 import numpy as np
-from typing import Dict, List, Optional, Tuple
+import io
+from typing import Dict, Optional, Tuple
 from pathlib import Path
 import logging
 from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+from matplotlib.patches import Rectangle
+from utils._coords import coords_to_array
 
 class MapGenerator:
-    def __init__(self):
-        """Initialize with color mappings and setup output directory"""
+    def __init__(self, projection: Optional[str] = None):
+        """
+        Initialize with color mappings and setup output directory
+        
+        Args:
+            projection: None to plot raw lon/lat, 'webmercator' or 'utm' for the
+                built-in kernels, or any other CRS string understood by pyproj
+        """
         self.color_map = {
             "granite": "#FF9999",
             "basalt": "#9999FF",
@@ -24,13 +34,43 @@ class MapGenerator:
         self.output_dir.mkdir(exist_ok=True)
         logging.basicConfig(level=logging.INFO)
 
+        # Projection backends are imported only when a projection is requested
+        self.projection = projection
+        self._utm_zone = (0, False)
+        self._proj_kernels = None
+        self._transformer = None
+        if projection in ("webmercator", "utm"):
+            from utils import _proj_kernels
+            self._proj_kernels = _proj_kernels
+        elif projection is not None:
+            from pyproj import Transformer
+            self._transformer = Transformer.from_crs("EPSG:4326", projection, always_xy=True)
+
+        # Figure, axes and legend handles are built once and reused for every map
+        self._fig = self._create_figure()
+        self._ax = self._fig.add_subplot(111)
+        self._legend_patches = [
+            Rectangle((0, 0), 1, 1, fc=color, alpha=0.6)
+            for color in self.color_map.values()
+        ]
+
+    def _project(self, lons: np.ndarray, lats: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Project lon/lat values into the map's coordinate system"""
+        lons = np.ascontiguousarray(lons, dtype=np.float64)
+        lats = np.ascontiguousarray(lats, dtype=np.float64)
+        if self.projection is None:
+            return lons, lats
+        if self._transformer is not None:
+            return self._transformer.transform(lons, lats)
+        return self._proj_kernels.project(self.projection, lons, lats, *self._utm_zone)
+
     def generate_detailed_map(self, survey_data: Dict) -> Optional[str]:
         """
         Generate and save a detailed geological map from survey data
         
         Args:
             survey_data: Dictionary containing:
-                - coordinates: List of {lat, lon, elevation}
+                - coordinates: (N, 3) lon/lat/elevation array or list of {lat, lon, elevation}
                 - units: Geological units data
                 - boundaries: Boundary data
                 - features: Structural features
@@ -40,8 +80,8 @@ class MapGenerator:
             Path to saved map image or None if failed
         """
         try:
-            fig = self._create_figure()
-            ax = fig.add_subplot(111)
+            fig, ax = self._fig, self._ax
+            ax.clear()
             
             # Plot all map elements
             self._plot_geological_features(ax, survey_data)
@@ -54,30 +94,36 @@ class MapGenerator:
         except Exception as e:
             logging.error(f"Map generation failed: {str(e)}", exc_info=True)
             return None
-        finally:
-            plt.close('all')  # Ensure clean up
 
-    def _create_figure(self) -> plt.Figure:
-        """Create a properly configured figure"""
-        fig = plt.figure(figsize=(12, 10), dpi=150)
+    def _create_figure(self) -> Figure:
+        """Create a properly configured figure outside pyplot's figure manager"""
+        # Constrained layout keeps the outside legend in frame without the
+        # extra render pass that savefig(bbox_inches='tight') needs
+        fig = Figure(figsize=(12, 10), dpi=150, layout='constrained')
         FigureCanvasAgg(fig)  # Set up proper canvas
         return fig
 
     def _plot_geological_features(self, ax: plt.Axes, data: Dict) -> None:
         """Plot all geological features on the map"""
         # Get coordinate bounds
-        lats = [p['lat'] for p in data['coordinates']]
-        lons = [p['lon'] for p in data['coordinates']]
+        coords = coords_to_array(data['coordinates'])
+        lons, lats = coords[:, 0], coords[:, 1]
+        if self.projection == "utm":
+            self._utm_zone = self._proj_kernels.utm_zone(lons.mean(), lats.mean())
         
         # Set plot limits with margin
         margin = 0.1
-        ax.set_xlim(min(lons)-margin, max(lons)+margin)
-        ax.set_ylim(min(lats)-margin, max(lats)+margin)
+        x_lim, y_lim = self._project(
+            [lons.min()-margin, lons.max()+margin],
+            [lats.min()-margin, lats.max()+margin]
+        )
+        ax.set_xlim(*x_lim)
+        ax.set_ylim(*y_lim)
         
         # Plot coordinates
+        xs, ys = self._project(lons, lats)
         ax.scatter(
-            [p['lon'] for p in data['coordinates']],
-            [p['lat'] for p in data['coordinates']],
+            xs, ys,
             color='red', s=50, zorder=5, label='Survey Points'
         )
         
@@ -96,11 +142,11 @@ class MapGenerator:
     def _plot_unit(self, ax: plt.Axes, unit: Dict) -> None:
         """Plot a geological unit polygon"""
         color = self.color_map.get(unit['type'].lower(), '#777777')
-        lons = [p['lon'] for p in unit['coordinates']]
-        lats = [p['lat'] for p in unit['coordinates']]
+        coords = coords_to_array(unit['coordinates'])
+        lons, lats = self._project(coords[:, 0], coords[:, 1])
         
         poly = plt.Polygon(
-            list(zip(lons, lats)),
+            np.column_stack((lons, lats)),
             facecolor=color,
             alpha=0.6,
             edgecolor='k',
@@ -123,30 +169,31 @@ class MapGenerator:
 
     def _plot_boundary(self, ax: plt.Axes, boundary: Dict) -> None:
         """Plot boundary between geological units"""
-        lons = [p['lon'] for p in boundary['coordinates']]
-        lats = [p['lat'] for p in boundary['coordinates']]
+        coords = coords_to_array(boundary['coordinates'])
+        lons, lats = self._project(coords[:, 0], coords[:, 1])
         ax.plot(lons, lats, 'k--', linewidth=1.2, alpha=0.7)
 
     def _plot_structural_feature(self, ax: plt.Axes, feature: Dict) -> None:
         """Plot structural features like faults"""
         if feature['type'] == 'fault':
-            lons = [p['lon'] for p in feature['coordinates']]
-            lats = [p['lat'] for p in feature['coordinates']]
+            coords = coords_to_array(feature['coordinates'])
+            lons, lats = self._project(coords[:, 0], coords[:, 1])
             line = ax.plot(lons, lats, 'r-', linewidth=2)[0]
             
-            # Add fault label
+            # Add fault label; :g keeps whole-metre displacements as "300m" rather than "300.0m"
             if len(lons) > 1:
                 mid = len(lons) // 2
+                displacement = feature.get('displacement')
                 ax.text(
                     lons[mid], lats[mid],
-                    f"Fault ({feature.get('displacement', '?')}m)",
+                    f"Fault ({displacement:g}m)" if displacement is not None else "Fault (?m)",
                     fontsize=8,
                     color='red',
                     rotation=self._calculate_angle(lons, lats, mid),
                     bbox=dict(facecolor='white', alpha=0.7)
                 )
 
-    def _calculate_angle(self, x: List[float], y: List[float], idx: int) -> float:
+    def _calculate_angle(self, x: np.ndarray, y: np.ndarray, idx: int) -> float:
         """Calculate label rotation angle for features"""
         if idx == 0:
             dx = x[1] - x[0]
@@ -159,19 +206,19 @@ class MapGenerator:
     def _add_map_decorations(self, ax: plt.Axes, survey_id: str) -> None:
         """Add title, legend, and other decorations"""
         ax.set_title(f"Geological Survey Map - {survey_id}", pad=20)
-        ax.set_xlabel("Longitude")
-        ax.set_ylabel("Latitude")
+        if self.projection is None:
+            ax.set_xlabel("Longitude")
+            ax.set_ylabel("Latitude")
+        else:
+            ax.set_xlabel("Easting (m)")
+            ax.set_ylabel("Northing (m)")
         ax.grid(True, linestyle=':', alpha=0.5)
         self._add_legend(ax)
 
     def _add_legend(self, ax: plt.Axes) -> None:
         """Add comprehensive legend to the map"""
-        patches = [
-            plt.Rectangle((0, 0), 1, 1, fc=color, alpha=0.6)
-            for color in self.color_map.values()
-        ]
         ax.legend(
-            patches,
+            self._legend_patches,
             self.color_map.keys(),
             title='Geological Units',
             loc='upper left',
@@ -179,14 +226,16 @@ class MapGenerator:
             borderaxespad=0.
         )
 
-    def _save_map(self, fig: plt.Figure, survey_id: str) -> str:
+    def _save_map(self, fig: Figure, survey_id: str) -> str:
         """Save the generated map to file"""
         map_path = self.output_dir / f"geological_map_{survey_id}.png"
+        buffer = io.BytesIO()
         fig.savefig(
-            map_path,
-            bbox_inches='tight',
+            buffer,
             dpi=150,
-            format='png'
+            format='png',
+            pil_kwargs={'compress_level': 1}  # Faster encode for slightly larger files
         )
+        map_path.write_bytes(buffer.getvalue())
         logging.info(f"Map successfully saved to {map_path}")
         return str(map_path)
\ No newline at end of file
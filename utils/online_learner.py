@@ -1,13 +1,19 @@
-import requests
+import asyncio
+import httpx
 from bs4 import BeautifulSoup
-from typing import List, Dict
-from pathlib import Path
-import json
+from typing import List, Dict, Optional, Tuple
 from core.knowledge_base import KnowledgeBase
 
+try:
+    import lxml  # noqa: F401 - only needed as the BeautifulSoup backend
+    HTML_PARSER = 'lxml'
+except ImportError:  # pragma: no cover - depends on installed packages
+    HTML_PARSER = 'html.parser'
+
 class OnlineLearner:
-    def __init__(self):
+    def __init__(self, transport: Optional[httpx.AsyncBaseTransport] = None):
         self.knowledge_base = KnowledgeBase()
+        self.transport = transport  # None uses httpx's default network transport
         self.sources = [
             "https://en.wikipedia.org/wiki/List_of_minerals",
             "https://en.wikipedia.org/wiki/List_of_rock_types",
@@ -16,27 +22,32 @@ class OnlineLearner:
 
     def update_knowledge_base(self) -> None:
         """Fetch new data from online sources and update knowledge base"""
-        new_minerals = self._scrape_mineral_data()
-        new_rocks = self._scrape_rock_data()
+        new_minerals, new_rocks = asyncio.run(self._scrape_all())
         
-        for mineral in new_minerals:
-            self.knowledge_base.add_mineral(mineral)
-            
-        for rock in new_rocks:
-            self.knowledge_base.add_rock(rock)
+        if new_minerals:
+            self.knowledge_base.add_minerals(new_minerals)
+        if new_rocks:
+            self.knowledge_base.add_rocks(new_rocks)
+
+    async def _scrape_all(self) -> Tuple[List[Dict], List[Dict]]:
+        """Download and parse all sources concurrently"""
+        async with httpx.AsyncClient(transport=self.transport, follow_redirects=True, timeout=30.0) as client:
+            minerals, rocks = await asyncio.gather(
+                self._scrape_mineral_data(client),
+                self._scrape_rock_data(client)
+            )
+        return minerals, rocks
 
-    def _scrape_mineral_data(self) -> List[Dict]:
+    async def _scrape_mineral_data(self, client: httpx.AsyncClient) -> List[Dict]:
         """Scrape mineral data from online sources"""
         minerals = []
         try:
-            response = requests.get(self.sources[0])
-            soup = BeautifulSoup(response.text, 'html.parser')
+            response = await client.get(self.sources[0])
+            soup = BeautifulSoup(response.text, HTML_PARSER)
             
             # This is a simplified example - real implementation would parse tables
-            tables = soup.find_all('table', {'class': 'wikitable'})
-            for table in tables:
-                rows = table.find_all('tr')
-                for row in rows[1:]:  # Skip header
+            for table in soup.select('table.wikitable'):
+                for row in table.select('tr')[1:]:  # Skip header
                     cols = row.find_all('td')
                     if len(cols) >= 2:
                         mineral = {
@@ -48,18 +59,16 @@ class OnlineLearner:
             print(f"Error scraping mineral data: {e}")
         return minerals
 
-    def _scrape_rock_data(self) -> List[Dict]:
+    async def _scrape_rock_data(self, client: httpx.AsyncClient) -> List[Dict]:
         """Scrape rock data from online sources"""
         rocks = []
         try:
-            response = requests.get(self.sources[1])
-            soup = BeautifulSoup(response.text, 'html.parser')
+            response = await client.get(self.sources[1])
+            soup = BeautifulSoup(response.text, HTML_PARSER)
             
             # This is a simplified example - real implementation would parse tables
-            tables = soup.find_all('table', {'class': 'wikitable'})
-            for table in tables:
-                rows = table.find_all('tr')
-                for row in rows[1:]:  # Skip header
+            for table in soup.select('table.wikitable'):
+                for row in table.select('tr')[1:]:  # Skip header
                     cols = row.find_all('td')
                     if len(cols) >= 2:
                         rock = {
@@ -70,4 +79,4 @@ class OnlineLearner:
                         rocks.append(rock)
         except Exception as e:
             print(f"Error scraping rock data: {e}")
-        return rocks
\ No newline at end of file
+        return rocks
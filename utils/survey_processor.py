@@ -1,18 +1,26 @@
 import numpy as np
 from typing import Dict, List
 from core.knowledge_base import KnowledgeBase
+from utils import _geo_kernels
+from utils._coords import coords_to_array
 
 class SurveyProcessor:
     def __init__(self):
         self.knowledge_base = KnowledgeBase()
 
     def process_survey_data(self, survey_data: Dict) -> Dict:
-        """Process raw survey data into structured geological information"""
+        """
+        Process raw survey data into structured geological information.
+        
+        All coordinates in the result are float64 NumPy arrays with lon, lat
+        (and elevation) columns: (N, 3) for survey points, boundaries and
+        features, (M, 2) for unit outlines.
+        """
         processed = {
             "units": self._identify_units(survey_data),
             "boundaries": self._identify_boundaries(survey_data),
             "structural_features": self._identify_structural_features(survey_data),
-            "coordinates": survey_data.get("coordinates", [])
+            "coordinates": coords_to_array(survey_data.get("coordinates", []))
         }
         return processed
 
@@ -23,7 +31,7 @@ class SurveyProcessor:
             detailed_info = self._get_unit_details(unit["type"])
             units.append({
                 "type": unit["type"],
-                "coordinates": unit["coordinates"],
+                "coordinates": coords_to_array(unit["coordinates"])[:, :2],
                 "properties": detailed_info,
                 "description": unit.get("description", "")
             })
@@ -47,52 +55,37 @@ class SurveyProcessor:
         units = survey_data.get("units", [])
         
         if len(units) > 1:
-            for i in range(len(units)-1):
+            # Interpolate every contact between consecutive units in one kernel call
+            starts = coords_to_array([unit["coordinates"][-1] for unit in units[:-1]])
+            ends = coords_to_array([unit["coordinates"][0] for unit in units[1:]])
+            paths = _geo_kernels.interpolate_many(starts, ends, 5)
+            
+            for i, path in enumerate(paths):
                 boundary = {
                     "type": "contact",
                     "between": [units[i]["type"], units[i+1]["type"]],
-                    "coordinates": self._interpolate_points(
-                        units[i]["coordinates"][-1],
-                        units[i+1]["coordinates"][0]
-                    )
+                    "coordinates": path
                 }
                 boundaries.append(boundary)
                 
         return boundaries
 
-    def _interpolate_points(self, point1: Dict, point2: Dict, n_points: int = 5) -> List[Dict]:
-        """Interpolate between two coordinate points"""
-        lat = np.linspace(point1["lat"], point2["lat"], n_points)
-        lon = np.linspace(point1["lon"], point2["lon"], n_points)
-        elev = np.linspace(point1.get("elevation", 0), point2.get("elevation", 0), n_points)
-        
-        return [
-            {"lat": lat[i], "lon": lon[i], "elevation": elev[i]}
-            for i in range(n_points)
-        ]
-
     def _identify_structural_features(self, survey_data: Dict) -> List[Dict]:
         """Identify structural features like faults or folds"""
         # This would be more sophisticated in a real implementation
         features = []
         
         # Simple example: if elevation changes dramatically, might be a fault
-        coordinates = survey_data.get("coordinates", [])
+        coordinates = coords_to_array(survey_data.get("coordinates", []))
         if len(coordinates) > 1:
-            elev_changes = [
-                abs(coordinates[i+1].get("elevation", 0) - coordinates[i].get("elevation", 0))
-                for i in range(len(coordinates)-1)
-            ]
+            elev = np.ascontiguousarray(coordinates[:, 2])
+            max_idx, max_change = _geo_kernels.max_elev_jump(elev)
             
-            if max(elev_changes) > 50:  # Threshold for fault (50 meters)
-                max_idx = elev_changes.index(max(elev_changes))
+            if max_change > 50:  # Threshold for fault (50 meters)
                 features.append({
                     "type": "fault",
-                    "coordinates": [
-                        coordinates[max_idx],
-                        coordinates[max_idx+1]
-                    ],
-                    "displacement": elev_changes[max_idx]
+                    "coordinates": coordinates[max_idx:max_idx+2],
+                    "displacement": float(max_change)
                 })
                 
         return features
\ No newline at end of file